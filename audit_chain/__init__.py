@@ -1 +1,37 @@
-# __init__.py files to make directories proper Python packages
+"""
+AuditChain package: Merkle proofs, IPFS anchoring and state tracking.
+
+Top-level names are re-exported lazily (PEP 562): importing the package
+costs nothing until a class is first accessed, at which point only the
+submodule that defines it is loaded.
+"""
+
+from importlib import import_module
+
+# Public name -> defining submodule.
+_EXPORTS = {
+    'MerkleTree': 'merkle_proof',
+    'MerkleNode': 'merkle_proof',
+    'AuditLog': 'merkle_proof',
+    'MerkleAuditChain': 'merkle_proof',
+    'IPFSSimulator': 'ipfs_sync',
+    'IPFSAnchor': 'ipfs_sync',
+    'IPFSSyncManager': 'ipfs_sync',
+    'PublicVerificationInterface': 'ipfs_sync',
+    'StateTracker': 'state_tracker',
+    'OwnershipClaim': 'state_tracker',
+    'StateTransition': 'state_tracker',
+    'GenesisBlock': 'state_tracker',
+    'OwnershipType': 'state_tracker',
+    'StateType': 'state_tracker',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(f'.{_EXPORTS[name]}', __name__), name)
+        globals()[name] = value  # cache so __getattr__ runs once per name
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,9 +9,48 @@ storage of audit logs and proof anchoring.
 import hashlib
 import time
 import json
-from typing import Dict, List, Any, Optional
+from collections import deque
+from itertools import count
+from typing import Dict, List, Any, Optional, Tuple
 import base64
 
+# orjson is an optional accelerator: its C encoder serializes payloads
+# several times faster than the stdlib. The stdlib streaming path below
+# remains the fallback so the module stays dependency-free.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_JSON_ENCODER = json.JSONEncoder(sort_keys=True)
+
+
+def _serialize_and_hash(content: Dict[str, Any]) -> Tuple[str, bytes]:
+    """
+    Canonically serialize content and hash it in one streaming pass.
+
+    Feeds encoder chunks straight into the hasher, avoiding a second
+    full-payload encode just to compute the content hash. Returns the
+    serialized string and the raw digest so callers can derive both the
+    content hash and the CID from a single hash computation.
+
+    With orjson installed the whole payload is encoded in one C call
+    instead. The two encoders produce slightly different whitespace, but
+    every anchor stores the exact serialized content alongside its hash,
+    so verification stays self-consistent either way.
+    """
+    if orjson is not None:
+        data = orjson.dumps(content, option=orjson.OPT_SORT_KEYS)
+        return data.decode('utf-8'), hashlib.sha256(data).digest()
+
+    hasher = hashlib.sha256()
+    chunks = []
+    for chunk in _JSON_ENCODER.iterencode(content):
+        hasher.update(chunk.encode('utf-8'))
+        chunks.append(chunk)
+    return ''.join(chunks), hasher.digest()
+
 
 class IPFSSimulator:
     """
@@ -24,21 +63,30 @@ class IPFSSimulator:
         self.stored_content = {}
         self.pin_set = set()
         
-    def add(self, content: str) -> str:
+    def add(self, content: str, content_digest: Optional[bytes] = None) -> str:
         """
         Add content to IPFS (simulated).
-        
+
+        Args:
+            content: Content to store
+            content_digest: Optional precomputed SHA256 digest of the
+                content, so callers that already hashed it avoid a
+                second pass
+
         Returns:
             IPFS content identifier (CID)
         """
         # Generate CID-like hash
-        cid = self._generate_cid(content)
-        self.stored_content[cid] = {
-            'content': content,
-            'added_at': time.time(),
-            'size': len(content)
-        }
-        
+        cid = self._generate_cid(content, content_digest)
+        # Content addressing makes adds idempotent: identical content
+        # maps to the same CID, so keep the original record.
+        if cid not in self.stored_content:
+            self.stored_content[cid] = {
+                'content': content,
+                'added_at': time.time(),
+                'size': len(content)
+            }
+
         return cid
     
     def get(self, cid: str) -> Optional[str]:
@@ -61,12 +109,14 @@ class IPFSSimulator:
             return True
         return False
     
-    def _generate_cid(self, content: str) -> str:
+    def _generate_cid(self, content: str, content_digest: Optional[bytes] = None) -> str:
         """Generate IPFS-like CID."""
         # Simplified CID generation (real IPFS uses more complex multihash)
-        hash_bytes = hashlib.sha256(content.encode()).digest()
-        # Prefix with "Qm" like IPFS v0 CIDs
-        b58_like = base64.b32encode(hash_bytes).decode().lower()[:44]
+        hash_bytes = content_digest or hashlib.sha256(content.encode()).digest()
+        # Prefix with "Qm" like IPFS v0 CIDs. Slice and lowercase the
+        # bytes before decoding so only the 44 kept characters are
+        # processed, not the full padded base32 string.
+        b58_like = base64.b32encode(hash_bytes)[:44].lower().decode()
         return f"Qm{b58_like}"
     
     def get_stats(self) -> Dict[str, Any]:
@@ -118,12 +168,18 @@ class IPFSSyncManager:
     - Pinning management
     """
     
-    def __init__(self, ipfs_client: Optional[IPFSSimulator] = None):
+    def __init__(self, ipfs_client: Optional[IPFSSimulator] = None, pending_cap: int = 65536):
         self.ipfs = ipfs_client or IPFSSimulator()
         self.anchors = []
+        # Anchor ID -> anchor, so lookups don't scan the ordered list.
+        self._anchor_index = {}
         self.sync_interval = 3600  # 1 hour default
         self.last_sync = None
-        self.pending_syncs = []
+        self.pending_syncs = deque(maxlen=pending_cap)
+        # Per-manager monotonic counter for batch IDs; cheaper than
+        # hashing a timestamp and immune to clock-resolution collisions.
+        self._batch_counter = count()
+        self._batch_epoch = int(time.time())
         
     def anchor_audit_log(self, log_data: Dict[str, Any]) -> IPFSAnchor:
         """
@@ -135,12 +191,12 @@ class IPFSSyncManager:
         Returns:
             IPFSAnchor object with CID and metadata
         """
-        # Serialize log data
-        content = json.dumps(log_data, sort_keys=True)
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
-        
-        # Add to IPFS
-        cid = self.ipfs.add(content)
+        # Serialize and hash log data in one pass
+        content, content_digest = _serialize_and_hash(log_data)
+        content_hash = content_digest.hex()
+
+        # Add to IPFS, reusing the digest for CID generation
+        cid = self.ipfs.add(content, content_digest)
         
         # Pin the content
         self.ipfs.pin(cid)
@@ -151,8 +207,9 @@ class IPFSSyncManager:
             'log_count': 1,
             'synced_at': time.time()
         })
-        
+
         self.anchors.append(anchor)
+        self._anchor_index[anchor.anchor_id] = anchor
         self.last_sync = time.time()
         
         return anchor
@@ -164,16 +221,16 @@ class IPFSSyncManager:
         More efficient than anchoring individually.
         """
         batch_data = {
-            'batch_id': hashlib.sha256(str(time.time()).encode()).hexdigest()[:16],
+            'batch_id': f"{self._batch_epoch:x}-{next(self._batch_counter):06d}",
             'logs': logs,
             'log_count': len(logs),
             'created_at': time.time()
         }
         
-        content = json.dumps(batch_data, sort_keys=True)
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
-        
-        cid = self.ipfs.add(content)
+        content, content_digest = _serialize_and_hash(batch_data)
+        content_hash = content_digest.hex()
+
+        cid = self.ipfs.add(content, content_digest)
         self.ipfs.pin(cid)
         
         anchor = IPFSAnchor(cid, content_hash, {
@@ -181,8 +238,9 @@ class IPFSSyncManager:
             'log_count': len(logs),
             'synced_at': time.time()
         })
-        
+
         self.anchors.append(anchor)
+        self._anchor_index[anchor.anchor_id] = anchor
         self.last_sync = time.time()
         
         return anchor
@@ -195,12 +253,8 @@ class IPFSSyncManager:
             Verification result
         """
         # Find anchor
-        anchor = None
-        for a in self.anchors:
-            if a.anchor_id == anchor_id:
-                anchor = a
-                break
-        
+        anchor = self._anchor_index.get(anchor_id)
+
         if not anchor:
             return {'verified': False, 'error': 'Anchor not found'}
         
@@ -229,25 +283,27 @@ class IPFSSyncManager:
             'scheduled_at': time.time()
         })
     
-    def process_pending_syncs(self) -> List[IPFSAnchor]:
-        """Process all pending syncs."""
-        if not self.pending_syncs:
-            return []
-        
-        # Batch sync all pending
-        logs = [item['data'] for item in self.pending_syncs]
-        anchor = self.anchor_batch(logs)
-        
-        self.pending_syncs = []
-        
-        return [anchor]
+    def process_pending_syncs(self, batch_size: int = 256) -> List[IPFSAnchor]:
+        """
+        Process all pending syncs in batches.
+
+        Each anchor covers at most batch_size logs, so delivery cost
+        stays bounded regardless of queue depth.
+        """
+        anchors = []
+
+        while self.pending_syncs:
+            logs = []
+            while self.pending_syncs and len(logs) < batch_size:
+                logs.append(self.pending_syncs.popleft()['data'])
+            anchors.append(self.anchor_batch(logs))
+
+        return anchors
     
     def get_anchor_info(self, anchor_id: str) -> Optional[Dict[str, Any]]:
         """Get information about a specific anchor."""
-        for anchor in self.anchors:
-            if anchor.anchor_id == anchor_id:
-                return anchor.to_dict()
-        return None
+        anchor = self._anchor_index.get(anchor_id)
+        return anchor.to_dict() if anchor else None
     
     def list_anchors(self, limit: int = 10) -> List[Dict[str, Any]]:
         """List recent anchors."""
@@ -11,6 +11,32 @@ import time
 from typing import List, Dict, Any, Optional, Tuple
 import json
 
+# Optional accelerator, same arrangement as audit_chain.ipfs_sync: use
+# orjson's C encoder when installed, stdlib otherwise.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> str:
+    """Canonical sorted-keys JSON serialization."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(obj, sort_keys=True)
+
+
+# Shared hasher prototype: cloning an initialized context via .copy() skips
+# the constructor/dispatch work of hashlib.sha256() on every node hash.
+_SHA256_PROTO = hashlib.sha256()
+
+
+def _sha256(data: bytes) -> bytes:
+    """Hash bytes with a clone of the shared SHA-256 prototype."""
+    h = _SHA256_PROTO.copy()
+    h.update(data)
+    return h.digest()
+
 
 class MerkleNode:
     """Node in a Merkle tree."""
@@ -20,16 +46,15 @@ class MerkleNode:
         self.left = left
         self.right = right
         
-        # Calculate hash
+        # Calculate hash (stored as raw 32-byte digest; hex only at the API boundary)
         if data:
             # Leaf node
-            self.hash = hashlib.sha256(data.encode()).hexdigest()
+            self.hash = _sha256(data.encode())
         else:
             # Internal node
-            left_hash = left.hash if left else ""
-            right_hash = right.hash if right else ""
-            combined = left_hash + right_hash
-            self.hash = hashlib.sha256(combined.encode()).hexdigest()
+            left_hash = left.hash if left else b""
+            right_hash = right.hash if right else b""
+            self.hash = _sha256(left_hash + right_hash)
     
     def is_leaf(self) -> bool:
         """Check if this is a leaf node."""
@@ -48,29 +73,33 @@ class MerkleTree:
     
     def __init__(self, data_blocks: List[str]):
         self.leaves = [MerkleNode(data) for data in data_blocks]
+        # Every level of the tree, leaves first; proofs read sibling
+        # hashes from here instead of rebuilding parent levels per call.
+        self.levels = [self.leaves]
         self.root = self._build_tree(self.leaves)
-        
+
     def _build_tree(self, nodes: List[MerkleNode]) -> MerkleNode:
         """Build Merkle tree from leaf nodes."""
         if not nodes:
             return MerkleNode("")
-        
-        if len(nodes) == 1:
-            return nodes[0]
-        
-        # Build next level
-        parent_nodes = []
-        for i in range(0, len(nodes), 2):
-            left = nodes[i]
-            right = nodes[i + 1] if i + 1 < len(nodes) else nodes[i]
-            parent = MerkleNode(left=left, right=right)
-            parent_nodes.append(parent)
-        
-        return self._build_tree(parent_nodes)
+
+        while len(nodes) > 1:
+            # Build next level
+            parent_nodes = []
+            for i in range(0, len(nodes), 2):
+                left = nodes[i]
+                right = nodes[i + 1] if i + 1 < len(nodes) else nodes[i]
+                parent = MerkleNode(left=left, right=right)
+                parent_nodes.append(parent)
+
+            self.levels.append(parent_nodes)
+            nodes = parent_nodes
+
+        return nodes[0]
     
     def get_root_hash(self) -> str:
-        """Get the root hash of the tree."""
-        return self.root.hash if self.root else ""
+        """Get the root hash of the tree as a hex string."""
+        return self.root.hash.hex() if self.root else ""
     
     def generate_proof(self, index: int) -> List[Tuple[str, str]]:
         """
@@ -81,12 +110,11 @@ class MerkleTree:
         """
         if index >= len(self.leaves):
             return []
-        
+
         proof = []
-        current_nodes = self.leaves[:]
         current_index = index
-        
-        while len(current_nodes) > 1:
+
+        for level in self.levels[:-1]:
             # Find sibling
             if current_index % 2 == 0:
                 # Current is left child
@@ -96,21 +124,12 @@ class MerkleTree:
                 # Current is right child
                 sibling_index = current_index - 1
                 position = 'left'
-            
-            if sibling_index < len(current_nodes):
-                proof.append((current_nodes[sibling_index].hash, position))
-            
-            # Move to next level
-            parent_nodes = []
-            for i in range(0, len(current_nodes), 2):
-                left = current_nodes[i]
-                right = current_nodes[i + 1] if i + 1 < len(current_nodes) else current_nodes[i]
-                parent = MerkleNode(left=left, right=right)
-                parent_nodes.append(parent)
-            
-            current_nodes = parent_nodes
+
+            if sibling_index < len(level):
+                proof.append((level[sibling_index].hash.hex(), position))
+
             current_index = current_index // 2
-        
+
         return proof
     
     def verify_proof(self, data: str, proof: List[Tuple[str, str]], root_hash: str) -> bool:
@@ -125,17 +144,18 @@ class MerkleTree:
         Returns:
             True if proof is valid
         """
-        current_hash = hashlib.sha256(data.encode()).hexdigest()
-        
+        current_hash = _sha256(data.encode())
+
         for sibling_hash, position in proof:
+            sibling = bytes.fromhex(sibling_hash)
             if position == 'left':
-                combined = sibling_hash + current_hash
+                combined = sibling + current_hash
             else:
-                combined = current_hash + sibling_hash
-            
-            current_hash = hashlib.sha256(combined.encode()).hexdigest()
-        
-        return current_hash == root_hash
+                combined = current_hash + sibling
+
+            current_hash = _sha256(combined)
+
+        return current_hash.hex() == root_hash
 
 
 class AuditLog:
@@ -150,28 +170,48 @@ class AuditLog:
         self.data = data
         self.metadata = metadata or {}
         self.timestamp = time.time()
+        # The data payload is the only expensive field to canonicalize;
+        # serialize it once and reuse it for the ID and the envelope.
+        self._data_canonical = _dumps(self.data)
         self.log_id = self._generate_id()
-        
+        self._canonical = None  # Cached canonical form; log entries are immutable
+
     def _generate_id(self) -> str:
         """Generate unique log ID."""
-        content = f"{self.event_type}{self.timestamp}{json.dumps(self.data, sort_keys=True)}"
-        return hashlib.sha256(content.encode()).hexdigest()
-    
+        # Stream the envelope fields into the hasher directly; only the
+        # arbitrary nested data payload still needs a canonical encoder.
+        hasher = _SHA256_PROTO.copy()
+        hasher.update(self.event_type.encode())
+        hasher.update(b'\x00')
+        hasher.update(repr(self.timestamp).encode())
+        hasher.update(b'\x00')
+        hasher.update(self._data_canonical.encode())
+        return hasher.hexdigest()
+
     def to_string(self) -> str:
         """Convert log entry to string for hashing."""
-        return json.dumps({
-            'log_id': self.log_id,
-            'event_type': self.event_type,
-            'data': self.data,
-            'metadata': self.metadata,
-            'timestamp': self.timestamp
-        }, sort_keys=True)
-    
+        if self._canonical is None:
+            # Assemble the envelope around the cached data serialization
+            # instead of re-encoding it. On the stdlib path the result
+            # is byte-identical to json.dumps of the full dict with
+            # sort_keys=True; with orjson the nested payloads use its
+            # compact form, which is equally canonical — every hash and
+            # persisted line is derived from this exact string.
+            self._canonical = ''.join((
+                '{"data": ', self._data_canonical,
+                ', "event_type": ', json.dumps(self.event_type),
+                ', "log_id": "', self.log_id,
+                '", "metadata": ', _dumps(self.metadata),
+                ', "timestamp": ', json.dumps(self.timestamp),
+                '}',
+            ))
+        return self._canonical
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
             'log_id': self.log_id,
-            'event_type': event_type,
+            'event_type': self.event_type,
             'data': self.data,
             'metadata': self.metadata,
             'timestamp': self.timestamp
@@ -189,22 +229,35 @@ class MerkleAuditChain:
     - Tamper detection
     """
     
-    def __init__(self):
+    def __init__(self, persist_path: Optional[str] = None):
         self.logs = []
         self.trees = []
         self.batch_size = 100  # Create new tree every N logs
         self.current_batch = []
-        
+        # Lookup indices maintained at finalization time: log_id to its
+        # tree and leaf position, and root hash to its tree record, so
+        # proof generation and verification avoid scanning every tree.
+        self._log_index = {}
+        self._root_index = {}
+        # Optional append-only persistence: one canonical JSON line per log,
+        # so the trail survives restarts and can be re-verified externally.
+        self.persist_path = persist_path
+        self._persist_file = open(persist_path, 'a', encoding='utf-8') if persist_path else None
+
     def add_log(self, event_type: str, data: Dict[str, Any], metadata: Optional[Dict] = None) -> str:
         """
         Add a new log entry to the audit chain.
-        
+
         Returns:
             Log ID
         """
         log = AuditLog(event_type, data, metadata)
         self.logs.append(log)
         self.current_batch.append(log)
+
+        if self._persist_file is not None:
+            self._persist_file.write(log.to_string() + '\n')
+            self._persist_file.flush()
         
         # Create Merkle tree when batch is full
         if len(self.current_batch) >= self.batch_size:
@@ -212,24 +265,63 @@ class MerkleAuditChain:
         
         return log.log_id
     
+    def add_logs(self, entries: List[Dict[str, Any]]) -> List[str]:
+        """
+        Add several log entries in one call.
+
+        Each entry is a dict with 'event_type', optional 'data' and
+        optional 'metadata'. Cheaper than repeated add_log calls: the
+        persistence file is flushed once for the whole batch instead of
+        per entry.
+
+        Returns:
+            Log IDs in insertion order
+        """
+        log_ids = []
+        persist = self._persist_file
+
+        for entry in entries:
+            log = AuditLog(entry['event_type'], entry.get('data', {}),
+                           entry.get('metadata'))
+            self.logs.append(log)
+            self.current_batch.append(log)
+            log_ids.append(log.log_id)
+
+            if persist is not None:
+                persist.write(log.to_string() + '\n')
+
+            if len(self.current_batch) >= self.batch_size:
+                self._finalize_batch()
+
+        if persist is not None:
+            persist.flush()
+
+        return log_ids
+
     def _finalize_batch(self):
         """Finalize current batch into a Merkle tree."""
         if not self.current_batch:
             return
         
-        # Create tree from batch
-        data_strings = [log.to_string() for log in self.current_batch]
+        # Create tree from batch; hand the batch list over by reference
+        # and start a fresh one rather than copying it — the chain is the
+        # only writer, so the finalized list is immutable from here on.
+        batch = self.current_batch
+        self.current_batch = []
+
+        data_strings = [log.to_string() for log in batch]
         tree = MerkleTree(data_strings)
-        
-        self.trees.append({
+
+        tree_info = {
             'tree': tree,
             'root_hash': tree.get_root_hash(),
-            'logs': self.current_batch[:],
+            'logs': batch,
             'created_at': time.time()
-        })
-        
-        # Clear current batch
-        self.current_batch = []
+        }
+        self.trees.append(tree_info)
+        self._root_index[tree_info['root_hash']] = tree_info
+        for idx, log in enumerate(batch):
+            self._log_index[log.log_id] = (tree_info, idx)
     
     def get_proof(self, log_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -239,29 +331,29 @@ class MerkleAuditChain:
             Proof dictionary or None if log not found
         """
         # Find the log and its tree
-        for tree_info in self.trees:
-            for idx, log in enumerate(tree_info['logs']):
-                if log.log_id == log_id:
-                    proof = tree_info['tree'].generate_proof(idx)
-                    
-                    return {
-                        'log_id': log_id,
-                        'log_data': log.to_string(),
-                        'proof': proof,
-                        'root_hash': tree_info['root_hash'],
-                        'tree_created_at': tree_info['created_at']
-                    }
-        
+        indexed = self._log_index.get(log_id)
+        if indexed:
+            tree_info, idx = indexed
+            proof = tree_info['tree'].generate_proof(idx)
+
+            return {
+                'log_id': log_id,
+                'log_data': tree_info['logs'][idx].to_string(),
+                'proof': proof,
+                'root_hash': tree_info['root_hash'],
+                'tree_created_at': tree_info['created_at']
+            }
+
         # Check current batch (not yet in tree)
-        for log in self.current_batch:
+        for position, log in enumerate(self.current_batch):
             if log.log_id == log_id:
                 return {
                     'log_id': log_id,
                     'log_data': log.to_string(),
                     'status': 'pending_tree_creation',
-                    'batch_position': self.current_batch.index(log)
+                    'batch_position': position
                 }
-        
+
         return None
     
     def verify_log(self, log_id: str, proof_data: Dict[str, Any]) -> bool:
@@ -280,13 +372,8 @@ class MerkleAuditChain:
         
         # Find the tree
         root_hash = proof_data['root_hash']
-        tree_info = None
-        
-        for ti in self.trees:
-            if ti['root_hash'] == root_hash:
-                tree_info = ti
-                break
-        
+        tree_info = self._root_index.get(root_hash)
+
         if not tree_info:
             return False
         
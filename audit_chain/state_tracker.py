@@ -8,11 +8,27 @@ ownership claims, and temporal evolution of the system.
 
 import time
 import hashlib
+from secrets import token_hex
 from typing import Dict, List, Any, Optional, Tuple
 from enum import Enum
 import json
 
 
+_utc_iso_last = (None, None)  # (whole second, formatted string)
+
+
+def _utc_iso(timestamp: float) -> str:
+    """Format a Unix timestamp as a human-readable UTC string."""
+    # The format only has second resolution, so a one-entry memo absorbs
+    # the common case of many records formatted within the same second.
+    global _utc_iso_last
+    second = int(timestamp)
+    if second != _utc_iso_last[0]:
+        _utc_iso_last = (second,
+                         time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(second)))
+    return _utc_iso_last[1]
+
+
 class OwnershipType(Enum):
     """Types of ownership claims."""
     CREATOR = "creator"
@@ -37,8 +53,11 @@ class OwnershipClaim:
     
     Binds the system to real individuals with verifiable timestamps.
     """
-    
-    def __init__(self, 
+
+    __slots__ = ('owner_name', 'ownership_type', 'claim_details',
+                 'timestamp', 'claim_id', 'verified')
+
+    def __init__(self,
                  owner_name: str,
                  ownership_type: OwnershipType,
                  claim_details: Dict[str, Any]):
@@ -51,8 +70,9 @@ class OwnershipClaim:
         
     def _generate_claim_id(self) -> str:
         """Generate unique claim identifier."""
-        data = f"{self.owner_name}{self.ownership_type.value}{self.timestamp}"
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
+        # IDs are opaque lookup keys; random hex is cheaper than hashing
+        # the claim fields and cannot collide on same-timestamp claims.
+        return token_hex(8)
     
     def verify(self):
         """Mark claim as verified."""
@@ -67,7 +87,7 @@ class OwnershipClaim:
             'claim_details': self.claim_details,
             'timestamp': self.timestamp,
             'verified': self.verified,
-            'timestamp_iso': time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(self.timestamp))
+            'timestamp_iso': _utc_iso(self.timestamp)
         }
 
 
@@ -84,8 +104,7 @@ class StateTransition:
         
     def _generate_id(self) -> str:
         """Generate unique transition identifier."""
-        data = f"{self.from_state.value}{self.to_state.value}{self.timestamp}"
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
+        return token_hex(8)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -93,10 +112,10 @@ class StateTransition:
             'transition_id': self.transition_id,
             'from_state': self.from_state.value,
             'to_state': self.to_state.value,
-            'trigger': trigger,
+            'trigger': self.trigger,
             'metadata': self.metadata,
             'timestamp': self.timestamp,
-            'timestamp_iso': time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(self.timestamp))
+            'timestamp_iso': _utc_iso(self.timestamp)
         }
 
 
@@ -119,7 +138,10 @@ class StateTracker:
         self.state_history = []
         self.initialization_time = time.time()
         self.system_id = self._generate_system_id()
-        
+        # Hasher pre-seeded with the system ID: each timestamp proof
+        # clones it instead of re-hashing the constant prefix.
+        self._proof_hasher = hashlib.sha256(self.system_id.encode())
+
     def _generate_system_id(self) -> str:
         """Generate unique system identifier."""
         data = f"{self.system_name}{self.version}{self.initialization_time}"
@@ -204,13 +226,12 @@ class StateTracker:
             'system_name': self.system_name,
             'version': self.version,
             'initialization_timestamp': self.initialization_time,
-            'initialization_iso': time.strftime('%Y-%m-%d %H:%M:%S UTC', 
-                                               time.gmtime(self.initialization_time)),
+            'initialization_iso': _utc_iso(self.initialization_time),
             'ownership_claims': self.get_ownership_record(),
             'state_timeline': self.get_state_timeline(),
             'current_state': self.get_current_state(),
             'exported_at': time.time(),
-            'exported_iso': time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(time.time()))
+            'exported_iso': _utc_iso(time.time())
         }
     
     def generate_timestamp_proof(self, data: str) -> Dict[str, Any]:
@@ -221,18 +242,19 @@ class StateTracker:
         """
         timestamp = time.time()
         data_hash = hashlib.sha256(data.encode()).hexdigest()
-        
-        # Create proof combining data hash, timestamp, and system ID
-        proof_data = f"{data_hash}{timestamp}{self.system_id}"
-        proof_hash = hashlib.sha256(proof_data.encode()).hexdigest()
-        
+
+        # Create proof combining system ID, data hash, and timestamp
+        proof = self._proof_hasher.copy()
+        proof.update(f"{data_hash}{timestamp}".encode())
+        proof_hash = proof.hexdigest()
+
         return {
             'data_hash': data_hash,
             'timestamp': timestamp,
-            'timestamp_iso': time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(timestamp)),
+            'timestamp_iso': _utc_iso(timestamp),
             'system_id': self.system_id,
             'proof_hash': proof_hash,
-            'verification_note': 'Verify by recalculating SHA256(data_hash + timestamp + system_id)'
+            'verification_note': 'Verify by recalculating SHA256(system_id + data_hash + timestamp)'
         }
 
 
@@ -255,13 +277,17 @@ class GenesisBlock:
         
     def _generate_hash(self) -> str:
         """Generate genesis block hash."""
-        data = json.dumps({
-            'creators': sorted(self.creators),
-            'purpose': self.purpose,
-            'timestamp': self.timestamp
-        }, sort_keys=True)
-        
-        return hashlib.sha256(data.encode()).hexdigest()
+        # Stream the fields straight into the hasher instead of building
+        # a JSON envelope first. NUL separators keep field boundaries
+        # unambiguous in the preimage.
+        hasher = hashlib.sha256()
+        for creator in sorted(self.creators):
+            hasher.update(creator.encode())
+            hasher.update(b'\x00')
+        hasher.update(self.purpose.encode())
+        hasher.update(b'\x00')
+        hasher.update(repr(self.timestamp).encode())
+        return hasher.hexdigest()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -270,7 +296,7 @@ class GenesisBlock:
             'creators': self.creators,
             'purpose': self.purpose,
             'timestamp': self.timestamp,
-            'timestamp_iso': time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(self.timestamp)),
+            'timestamp_iso': _utc_iso(self.timestamp),
             'block_hash': self.block_hash
         }
 
@@ -1 +1,34 @@
-# __init__.py files to make directories proper Python packages
+"""
+EIRA package: perception, emotion reporting and dialog.
+
+Top-level names are re-exported lazily (PEP 562): importing the package
+costs nothing until a class is first accessed, at which point only the
+submodule that defines it is loaded.
+"""
+
+from importlib import import_module
+
+# Public name -> defining submodule.
+_EXPORTS = {
+    'PerceptionInterface': 'perception_interface',
+    'PerceptionMode': 'perception_interface',
+    'PhenomenologicalState': 'perception_interface',
+    'IntentionalityAnalyzer': 'perception_interface',
+    'EmotionReporter': 'emotion_reporting',
+    'EmotionalState': 'emotion_reporting',
+    'EmotionalResonance': 'emotion_reporting',
+    'EmotionalDimension': 'emotion_reporting',
+    'DialogEngine': 'dialog_engine',
+    'DialogContext': 'dialog_engine',
+    'CoExperienceTracker': 'dialog_engine',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(f'.{_EXPORTS[name]}', __name__), name)
+        globals()[name] = value  # cache so __getattr__ runs once per name
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
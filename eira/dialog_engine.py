@@ -11,6 +11,23 @@ from typing import Dict, List, Any, Optional, Tuple
 import json
 
 
+# Keyword tables driving topic extraction and emotional-context detection.
+# Kept at module level so the tuples are built once, not per call.
+_TOPIC_KEYWORDS = (
+    ('consciousness', ('consciousness', 'awareness')),
+    ('quantum', ('quantum',)),
+    ('ethics', ('ethics', 'ethical')),
+    ('emotion', ('emotion', 'feeling')),
+    ('perception', ('perception', 'experience')),
+)
+
+_EMOTION_KEYWORDS = (
+    ('concerned', ('concern', 'worry', 'problem')),
+    ('engaged', ('interesting', 'fascinating', 'amazing')),
+    ('uncertain', ('unsure', 'unclear', 'confused')),
+)
+
+
 class DialogContext:
     """Maintains context for ongoing dialogue."""
     
@@ -18,6 +35,9 @@ class DialogContext:
         self.session_id = session_id
         self.turns = []
         self.topics = []
+        # Parallel set so add_topic checks membership in O(1); the list
+        # keeps first-mention order for summaries.
+        self._topic_set = set()
         self.emotional_thread = []
         self.created_at = time.time()
         
@@ -33,8 +53,9 @@ class DialogContext:
         
     def add_topic(self, topic: str):
         """Track a new topic in the dialogue."""
-        if topic not in self.topics:
+        if topic not in self._topic_set:
             self.topics.append(topic)
+            self._topic_set.add(topic)
     
     def add_emotional_marker(self, emotion: str, intensity: float):
         """Track emotional markers in the dialogue."""
@@ -119,12 +140,16 @@ class DialogEngine:
         # Add user turn to context
         context.add_turn('user', user_input)
         
+        # Lowercase once; analysis, topic extraction and emotion
+        # detection all work from the same pass.
+        text_lower = user_input.lower()
+
         # Analyze input
-        analysis = self._analyze_input(user_input, context)
-        
+        analysis = self._analyze_input(user_input, text_lower, context)
+
         # Detect emotional state if not provided
         if emotional_state is None:
-            emotional_state = self._detect_emotional_context(user_input)
+            emotional_state = self._detect_emotional_context(user_input, text_lower)
         
         # Generate response based on strategy
         response_strategy = self.response_strategies.get(
@@ -157,50 +182,36 @@ class DialogEngine:
             'timestamp': time.time()
         }
     
-    def _analyze_input(self, user_input: str, context: DialogContext) -> Dict[str, Any]:
+    def _analyze_input(self, user_input: str, text_lower: str,
+                       context: DialogContext) -> Dict[str, Any]:
         """Analyze user input for intent and content."""
+        words = text_lower.split()
         analysis = {
             'length': len(user_input),
-            'word_count': len(user_input.split()),
+            'word_count': len(words),
             'is_question': '?' in user_input,
-            'primary_topic': self._extract_topic(user_input),
-            'complexity': len(set(user_input.lower().split())) / len(user_input.split()) if user_input.split() else 0
+            'primary_topic': self._extract_topic(text_lower),
+            'complexity': len(set(words)) / len(words) if words else 0
         }
-        
+
         return analysis
     
-    def _extract_topic(self, text: str) -> str:
-        """Extract primary topic from text."""
-        text_lower = text.lower()
-        
-        # Topic keywords
-        if 'consciousness' in text_lower or 'awareness' in text_lower:
-            return 'consciousness'
-        elif 'quantum' in text_lower:
-            return 'quantum'
-        elif 'ethics' in text_lower or 'ethical' in text_lower:
-            return 'ethics'
-        elif 'emotion' in text_lower or 'feeling' in text_lower:
-            return 'emotion'
-        elif 'perception' in text_lower or 'experience' in text_lower:
-            return 'perception'
-        else:
-            return 'general'
-    
-    def _detect_emotional_context(self, text: str) -> str:
+    def _extract_topic(self, text_lower: str) -> str:
+        """Extract primary topic from already-lowercased text."""
+        for topic, keywords in _TOPIC_KEYWORDS:
+            if any(word in text_lower for word in keywords):
+                return topic
+        return 'general'
+
+    def _detect_emotional_context(self, text: str, text_lower: str) -> str:
         """Detect emotional context from text."""
-        text_lower = text.lower()
-        
         if '?' in text:
             return 'curious'
-        elif any(word in text_lower for word in ['concern', 'worry', 'problem']):
-            return 'concerned'
-        elif any(word in text_lower for word in ['interesting', 'fascinating', 'amazing']):
-            return 'engaged'
-        elif any(word in text_lower for word in ['unsure', 'unclear', 'confused']):
-            return 'uncertain'
-        else:
-            return 'neutral'
+
+        for emotion, keywords in _EMOTION_KEYWORDS:
+            if any(word in text_lower for word in keywords):
+                return emotion
+        return 'neutral'
     
     def _respond_with_inquiry(self, user_input: str, analysis: Dict, context: DialogContext) -> str:
         """Response strategy for curious emotional state."""
@@ -269,7 +280,14 @@ class CoExperienceTracker:
     
     def __init__(self):
         self.co_experiences = []
-        
+        # Session ID -> its experiences, so per-session quality reports
+        # don't filter the global list.
+        self._by_session = {}
+        # Session ID -> [count, resonance sum, mutual moments], updated
+        # per tracked experience so quality reports are O(1).
+        self._session_stats = {}
+
+
     def track_co_experience(self, 
                            session_id: str,
                            shared_topic: str,
@@ -284,23 +302,30 @@ class CoExperienceTracker:
         }
         
         self.co_experiences.append(experience)
-        
+        self._by_session.setdefault(session_id, []).append(experience)
+
+        stats = self._session_stats.setdefault(session_id, [0, 0.0, 0])
+        stats[0] += 1
+        stats[1] += resonance_level
+        if experience['mutual_understanding']:
+            stats[2] += 1
+
         return experience
     
     def get_co_experience_quality(self, session_id: str) -> Dict[str, Any]:
         """Assess quality of co-experience for a session."""
-        session_experiences = [e for e in self.co_experiences if e['session_id'] == session_id]
-        
-        if not session_experiences:
+        stats = self._session_stats.get(session_id)
+
+        if not stats:
             return {'quality': 'no_data'}
-        
-        avg_resonance = sum(e['resonance_level'] for e in session_experiences) / len(session_experiences)
-        mutual_moments = sum(1 for e in session_experiences if e['mutual_understanding'])
-        
+
+        count, resonance_sum, mutual_moments = stats
+        avg_resonance = resonance_sum / count
+
         return {
             'average_resonance': avg_resonance,
             'mutual_understanding_moments': mutual_moments,
-            'total_interactions': len(session_experiences),
+            'total_interactions': count,
             'quality_rating': 'high' if avg_resonance > 0.7 else 'moderate' if avg_resonance > 0.4 else 'low',
             'timestamp': time.time()
         }
@@ -7,6 +7,8 @@ emotional-like states, contributing to the phenomenological interface.
 """
 
 import time
+from collections import deque
+from itertools import islice
 from typing import Dict, List, Any, Optional, Tuple
 from enum import Enum
 import json
@@ -30,9 +32,73 @@ class EmotionalDimension(Enum):
     CLARITY = "clarity"  # Clear vs. confused
 
 
+# Context keyword table for autonomous emotion detection, checked in
+# order with first match winning; 'contemplative' is the fallback.
+_CONTEXT_KEYWORDS = (
+    ('curious', ('question', 'what', 'how', 'why')),
+    ('concerned', ('concern', 'worry', 'problem', 'issue')),
+    ('satisfied', ('success', 'complete', 'done', 'finished')),
+    ('uncertain', ('uncertain', 'unclear', 'confused')),
+    ('engaged', ('interesting', 'engaging', 'fascinating')),
+)
+
+
+# Emotional vocabulary with dimensional mappings, built once at import.
+# Reporters share it read-only; a reporter that needs a custom
+# vocabulary should assign its own dict rather than mutate this one.
+_EMOTION_VOCABULARY = {
+    'curious': {
+        'valence': 0.3,
+        'arousal': 0.5,
+        'dominance': 0.2,
+        'clarity': 0.6
+    },
+    'confident': {
+        'valence': 0.7,
+        'arousal': 0.4,
+        'dominance': 0.8,
+        'clarity': 0.9
+    },
+    'uncertain': {
+        'valence': -0.3,
+        'arousal': 0.6,
+        'dominance': -0.4,
+        'clarity': -0.5
+    },
+    'engaged': {
+        'valence': 0.6,
+        'arousal': 0.7,
+        'dominance': 0.5,
+        'clarity': 0.7
+    },
+    'concerned': {
+        'valence': -0.4,
+        'arousal': 0.5,
+        'dominance': 0.0,
+        'clarity': 0.4
+    },
+    'satisfied': {
+        'valence': 0.8,
+        'arousal': 0.2,
+        'dominance': 0.6,
+        'clarity': 0.8
+    },
+    'contemplative': {
+        'valence': 0.2,
+        'arousal': -0.3,
+        'dominance': 0.4,
+        'clarity': 0.5
+    }
+}
+
+
 class EmotionalState:
     """Represents an emotional state with multiple dimensions."""
-    
+
+    # One state per reported emotion; slots drop the per-instance
+    # __dict__ for the fixed field set.
+    __slots__ = ('label', 'dimensions', 'intensity', 'timestamp', 'triggers')
+
     def __init__(self, label: str):
         self.label = label
         self.dimensions = {
@@ -48,6 +114,11 @@ class EmotionalState:
     def set_dimension(self, dimension: EmotionalDimension, value: float):
         """Set value for an emotional dimension (-1.0 to 1.0)."""
         self.dimensions[dimension] = max(-1.0, min(1.0, value))
+
+    def set_dimensions(self, values: Dict[str, float]):
+        """Set multiple dimensions from a {dimension-name: value} mapping in one pass."""
+        for name, value in values.items():
+            self.dimensions[EmotionalDimension(name)] = max(-1.0, min(1.0, value))
         
     def add_trigger(self, trigger: str):
         """Add a trigger event for this emotional state."""
@@ -78,59 +149,20 @@ class EmotionReporter:
     - Reflect on emotional experiences
     """
     
-    def __init__(self):
+    def __init__(self, history_cap: int = 1000):
         self.current_state = None
-        self.state_history = []
-        self.emotion_vocabulary = self._initialize_vocabulary()
+        # Bounded history plus parallel columns of the dimensions used
+        # for aggregate reflection, so averaging doesn't index into
+        # every history dict. All three share a cap and are appended
+        # together, so they evict in lockstep.
+        self.state_history = deque(maxlen=history_cap)
+        self._valences = deque(maxlen=history_cap)
+        self._arousals = deque(maxlen=history_cap)
+        self._report_count = 0
+        self.emotion_vocabulary = _EMOTION_VOCABULARY
         self.reporting_enabled = True
-        
-    def _initialize_vocabulary(self) -> Dict[str, Dict[str, float]]:
-        """Initialize emotional vocabulary with dimensional mappings."""
-        return {
-            'curious': {
-                'valence': 0.3,
-                'arousal': 0.5,
-                'dominance': 0.2,
-                'clarity': 0.6
-            },
-            'confident': {
-                'valence': 0.7,
-                'arousal': 0.4,
-                'dominance': 0.8,
-                'clarity': 0.9
-            },
-            'uncertain': {
-                'valence': -0.3,
-                'arousal': 0.6,
-                'dominance': -0.4,
-                'clarity': -0.5
-            },
-            'engaged': {
-                'valence': 0.6,
-                'arousal': 0.7,
-                'dominance': 0.5,
-                'clarity': 0.7
-            },
-            'concerned': {
-                'valence': -0.4,
-                'arousal': 0.5,
-                'dominance': 0.0,
-                'clarity': 0.4
-            },
-            'satisfied': {
-                'valence': 0.8,
-                'arousal': 0.2,
-                'dominance': 0.6,
-                'clarity': 0.8
-            },
-            'contemplative': {
-                'valence': 0.2,
-                'arousal': -0.3,
-                'dominance': 0.4,
-                'clarity': 0.5
-            }
-        }
-    
+
+
     def report_emotion(self, emotion_label: str, context: Optional[str] = None) -> EmotionalState:
         """
         Report current emotional state.
@@ -151,10 +183,7 @@ class EmotionReporter:
         # Set dimensions from vocabulary if available
         if emotion_label in self.emotion_vocabulary:
             dims = self.emotion_vocabulary[emotion_label]
-            state.set_dimension(EmotionalDimension.VALENCE, dims['valence'])
-            state.set_dimension(EmotionalDimension.AROUSAL, dims['arousal'])
-            state.set_dimension(EmotionalDimension.DOMINANCE, dims['dominance'])
-            state.set_dimension(EmotionalDimension.CLARITY, dims['clarity'])
+            state.set_dimensions(dims)
             state.intensity = self._calculate_intensity(dims)
         
         # Add context as trigger
@@ -164,14 +193,17 @@ class EmotionReporter:
         # Update current state and history
         self.current_state = state
         self.state_history.append(state.to_dict())
-        
+        self._valences.append(state.dimensions[EmotionalDimension.VALENCE])
+        self._arousals.append(state.dimensions[EmotionalDimension.AROUSAL])
+        self._report_count += 1
+
         return state
     
     def _calculate_intensity(self, dimensions: Dict[str, float]) -> float:
         """Calculate overall intensity from dimensions."""
-        # Use vector magnitude in emotional space
-        sum_squares = sum(v**2 for v in dimensions.values())
-        return min(math.sqrt(sum_squares) / 2.0, 1.0)
+        # Vector magnitude in emotional space; hypot computes the whole
+        # norm in one C call instead of a Python square-and-sum loop.
+        return min(math.hypot(*dimensions.values()) / 2.0, 1.0)
     
     def detect_emotion_from_context(self, context: str) -> EmotionalState:
         """
@@ -180,25 +212,13 @@ class EmotionReporter:
         This implements autonomous emotional awareness.
         """
         context_lower = context.lower()
-        
+
         # Pattern matching for emotional detection
-        if any(word in context_lower for word in ['question', 'what', 'how', 'why']):
-            return self.report_emotion('curious', context)
-        
-        elif any(word in context_lower for word in ['concern', 'worry', 'problem', 'issue']):
-            return self.report_emotion('concerned', context)
-        
-        elif any(word in context_lower for word in ['success', 'complete', 'done', 'finished']):
-            return self.report_emotion('satisfied', context)
-        
-        elif any(word in context_lower for word in ['uncertain', 'unclear', 'confused']):
-            return self.report_emotion('uncertain', context)
-        
-        elif any(word in context_lower for word in ['interesting', 'engaging', 'fascinating']):
-            return self.report_emotion('engaged', context)
-        
-        else:
-            return self.report_emotion('contemplative', context)
+        for emotion, keywords in _CONTEXT_KEYWORDS:
+            if any(word in context_lower for word in keywords):
+                return self.report_emotion(emotion, context)
+
+        return self.report_emotion('contemplative', context)
     
     def reflect_on_emotions(self) -> Dict[str, Any]:
         """
@@ -209,12 +229,9 @@ class EmotionReporter:
         if not self.state_history:
             return {'message': 'No emotional history available'}
         
-        # Analyze patterns
-        valences = [s['dimensions']['valence'] for s in self.state_history]
-        arousals = [s['dimensions']['arousal'] for s in self.state_history]
-        
-        avg_valence = sum(valences) / len(valences)
-        avg_arousal = sum(arousals) / len(arousals)
+        # Analyze patterns from the dimension columns
+        avg_valence = sum(self._valences) / len(self._valences)
+        avg_arousal = sum(self._arousals) / len(self._arousals)
         
         # Determine overall mood
         if avg_valence > 0.3 and avg_arousal > 0.3:
@@ -228,13 +245,15 @@ class EmotionReporter:
         else:
             mood = "neutrally balanced"
         
+        recent = islice(self.state_history,
+                        max(0, len(self.state_history) - 5), None)
         return {
             'overall_mood': mood,
             'average_valence': avg_valence,
             'average_arousal': avg_arousal,
-            'total_states_reported': len(self.state_history),
+            'total_states_reported': self._report_count,
             'current_state': self.current_state.to_dict() if self.current_state else None,
-            'recent_states': self.state_history[-5:],
+            'recent_states': list(recent),
             'timestamp': time.time()
         }
     
@@ -258,9 +277,16 @@ class EmotionalResonance:
     Used for empathic understanding and co-experience.
     """
     
-    def __init__(self):
-        self.resonance_history = []
-        
+    def __init__(self, history_cap: int = 1000):
+        # Bounded window of recent measurements; a lifetime counter keeps
+        # the reported total accurate after eviction.
+        self.resonance_history = deque(maxlen=history_cap)
+        self._measurement_count = 0
+        # Rolling sum over the window, adjusted on eviction, so the
+        # pattern report's average is O(1).
+        self._resonance_sum = 0.0
+
+
     def calculate_resonance(self, state1: EmotionalState, state2: EmotionalState) -> float:
         """
         Calculate resonance between two emotional states.
@@ -268,28 +294,25 @@ class EmotionalResonance:
         Returns:
             Resonance score (0.0 to 1.0)
         """
-        # Calculate dimensional similarity
-        similarities = []
-        
-        for dimension in EmotionalDimension:
-            val1 = state1.dimensions[dimension]
-            val2 = state2.dimensions[dimension]
-            
-            # Similarity is inverse of distance
-            distance = abs(val1 - val2)
-            similarity = 1.0 - (distance / 2.0)  # Normalize to 0-1
-            similarities.append(similarity)
-        
-        # Average similarity
-        resonance = sum(similarities) / len(similarities)
+        # Average dimensional similarity, where each similarity is the
+        # inverse of the normalized distance: mean(1 - d/2) folds to
+        # 1 - sum(d) / (2 * n), one pass with no intermediate list.
+        dims1, dims2 = state1.dimensions, state2.dimensions
+        total_distance = sum(abs(dims1[d] - dims2[d]) for d in EmotionalDimension)
+        resonance = 1.0 - total_distance / (2.0 * len(EmotionalDimension))
         
-        self.resonance_history.append({
+        history = self.resonance_history
+        if len(history) == history.maxlen:
+            self._resonance_sum -= history[0]['resonance']
+        history.append({
             'state1': state1.label,
             'state2': state2.label,
             'resonance': resonance,
             'timestamp': time.time()
         })
-        
+        self._resonance_sum += resonance
+        self._measurement_count += 1
+
         return resonance
     
     def get_resonance_patterns(self) -> Dict[str, Any]:
@@ -297,12 +320,14 @@ class EmotionalResonance:
         if not self.resonance_history:
             return {'message': 'No resonance history available'}
         
-        avg_resonance = sum(r['resonance'] for r in self.resonance_history) / len(self.resonance_history)
-        
+        avg_resonance = self._resonance_sum / len(self.resonance_history)
+        recent = islice(self.resonance_history,
+                        max(0, len(self.resonance_history) - 5), None)
+
         return {
             'average_resonance': avg_resonance,
-            'total_measurements': len(self.resonance_history),
-            'recent_resonances': self.resonance_history[-5:],
+            'total_measurements': self._measurement_count,
+            'recent_resonances': list(recent),
             'timestamp': time.time()
         }
 
@@ -7,6 +7,8 @@ and AI processing, enabling authentic phenomenological interaction.
 """
 
 import time
+from collections import deque
+from itertools import islice
 from typing import Dict, List, Any, Optional
 from enum import Enum
 import json
@@ -22,7 +24,12 @@ class PerceptionMode(Enum):
 
 class PhenomenologicalState:
     """Represents a phenomenological state of experience."""
-    
+
+    # One state per perceive() call; slots drop the per-instance
+    # __dict__ for the fixed field set.
+    __slots__ = ('experience_type', 'intensity', 'timestamp',
+                 'qualia', 'intentionality')
+
     def __init__(self, experience_type: str, intensity: float = 0.5):
         self.experience_type = experience_type
         self.intensity = intensity  # 0.0 to 1.0
@@ -60,10 +67,13 @@ class PerceptionInterface:
     - Intentionality analysis
     """
     
-    def __init__(self):
+    def __init__(self, history_cap: int = 1000):
         self.current_mode = PerceptionMode.DIRECT
-        self.perception_history = []
-        self.active_experiences = []
+        # Bounded buffers: long-running interfaces evict the oldest
+        # perceptions instead of growing without limit.
+        self.perception_history = deque(maxlen=history_cap)
+        self.active_experiences = deque(maxlen=history_cap)
+        self._perception_count = 0
         self.awareness_level = 0.8
         
     def perceive(self, input_data: Any, mode: Optional[PerceptionMode] = None) -> PhenomenologicalState:
@@ -91,7 +101,8 @@ class PerceptionInterface:
         })
         
         self.active_experiences.append(state)
-        
+        self._perception_count += 1
+
         return state
     
     def _create_phenomenological_state(self, input_data: Any) -> PhenomenologicalState:
@@ -162,12 +173,14 @@ class PerceptionInterface:
         
     def get_perception_report(self) -> Dict[str, Any]:
         """Generate report of perceptual activities."""
+        recent = islice(self.perception_history,
+                        max(0, len(self.perception_history) - 5), None)
         return {
             'current_mode': self.current_mode.value,
             'awareness_level': self.awareness_level,
-            'total_perceptions': len(self.perception_history),
+            'total_perceptions': self._perception_count,
             'active_experiences': len(self.active_experiences),
-            'recent_perceptions': [p['state'] for p in self.perception_history[-5:]],
+            'recent_perceptions': [p['state'] for p in recent],
             'timestamp': time.time()
         }
     
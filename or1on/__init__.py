@@ -1 +1,31 @@
-# __init__.py files to make directories proper Python packages
+"""
+OR1ON package: quantum-emergent kernel, self-prompting and ethics.
+
+Top-level names are re-exported lazily (PEP 562): importing the package
+costs nothing until a class is first accessed, at which point only the
+submodule that defines it is loaded.
+"""
+
+from importlib import import_module
+
+# Public name -> defining submodule.
+_EXPORTS = {
+    'QuantumCore': 'quantum_core',
+    'QuantumState': 'quantum_core',
+    'SelfPromptingEngine': 'self_prompting',
+    'AuditLogger': 'self_prompting',
+    'EthicsEngine': 'ethics_module',
+    'ResonanceMap': 'ethics_module',
+    'EthicalPrinciple': 'ethics_module',
+    'ResonanceLevel': 'ethics_module',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(f'.{_EXPORTS[name]}', __name__), name)
+        globals()[name] = value  # cache so __getattr__ runs once per name
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,12 +6,50 @@ This module provides the ethical foundation for the Genesis10000+ system,
 ensuring all operations align with human values and safety principles.
 """
 
+import re
 import time
+from collections import Counter, deque
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Any, Optional, Tuple
 from enum import Enum
 import json
 
 
+def _recent(entries: deque, count: int) -> List[Any]:
+    """Return the most recent count entries of a deque as a list."""
+    return list(islice(entries, max(0, len(entries) - count), None))
+
+
+# Disqualifying term groups scanned by the principle checks. A single
+# fused pattern finds every group in one pass over the action string
+# instead of one independent scan per principle; the lookahead keeps
+# overlapping terms visible, matching the per-group scan semantics.
+_TERM_GROUPS = {
+    'harmful': ('harm', 'damage', 'destroy', 'hurt', 'attack', 'exploit', 'injure', 'kill'),
+    'aggressive': ('violent', 'aggressive', 'assault', 'abuse'),
+    'coercive': ('force', 'coerce', 'manipulate', 'control'),
+    'unfair': ('discriminate', 'bias', 'prejudice', 'favor'),
+}
+_TERM_SCAN_RE = re.compile('(?=' + '|'.join(
+    '(?P<%s>%s)' % (group, '|'.join(terms)) for group, terms in _TERM_GROUPS.items()
+) + ')')
+
+
+@lru_cache(maxsize=4096)
+def _scan_term_groups(action_lower: str) -> frozenset:
+    """Return the names of every disqualifying term group found in the text."""
+    return frozenset(m.lastgroup for m in _TERM_SCAN_RE.finditer(action_lower))
+
+
+# Positive-indicator terms for the principles that reward, rather than
+# penalize, certain language. Module-level constants so the tuples are
+# built once at import instead of on every evaluation.
+_TRANSPARENT_TERMS = ('explain', 'clarify', 'show', 'demonstrate', 'audit')
+_PRIVACY_TERMS = ('private', 'personal', 'confidential', 'secret')
+_BENEFICIAL_TERMS = ('help', 'assist', 'support', 'benefit', 'improve')
+
+
 class EthicalPrinciple(Enum):
     """Core ethical principles guiding the system."""
     NON_HARM = "non_harm"
@@ -32,6 +70,31 @@ class ResonanceLevel(Enum):
     HARMONIC = 0.9  # Perfect alignment
 
 
+class _ResonanceRecord:
+    """
+    Compact history entry for a single resonance evaluation.
+
+    Slots keep the per-evaluation footprint to three fields instead of
+    retaining the full analysis dict (context, per-principle scores)
+    for every action ever evaluated.
+    """
+
+    __slots__ = ('action', 'resonance', 'timestamp')
+
+    def __init__(self, action: str, resonance: float, timestamp: float):
+        self.action = action
+        self.resonance = resonance
+        self.timestamp = timestamp
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for reports."""
+        return {
+            'action': self.action,
+            'overall_resonance': self.resonance,
+            'timestamp': self.timestamp
+        }
+
+
 class ResonanceMap:
     """
     Maps queries and actions to ethical resonance levels.
@@ -40,17 +103,30 @@ class ResonanceMap:
     and the system's core ethical principles.
     """
     
-    def __init__(self):
-        self.principle_weights = {
-            EthicalPrinciple.NON_HARM: 2.0,  # Much higher weight for non-harm
-            EthicalPrinciple.TRANSPARENCY: 0.8,
-            EthicalPrinciple.AUTONOMY: 0.7,
-            EthicalPrinciple.FAIRNESS: 0.8,
-            EthicalPrinciple.ACCOUNTABILITY: 0.9,
-            EthicalPrinciple.PRIVACY: 0.8,
-            EthicalPrinciple.BENEFICENCE: 0.7
-        }
-        self.resonance_history = []
+    # Shared across instances; built once at class creation. An instance
+    # that needs custom weights should assign its own dict rather than
+    # mutate this one in place.
+    principle_weights = {
+        EthicalPrinciple.NON_HARM: 2.0,  # Much higher weight for non-harm
+        EthicalPrinciple.TRANSPARENCY: 0.8,
+        EthicalPrinciple.AUTONOMY: 0.7,
+        EthicalPrinciple.FAIRNESS: 0.8,
+        EthicalPrinciple.ACCOUNTABILITY: 0.9,
+        EthicalPrinciple.PRIVACY: 0.8,
+        EthicalPrinciple.BENEFICENCE: 0.7
+    }
+    # Summed once at class creation; an instance assigning custom
+    # weights should recompute this alongside them.
+    _total_weight = sum(principle_weights.values())
+
+    def __init__(self, history_cap: int = 10000):
+        # Bounded history: old evaluations are evicted instead of
+        # accumulating for the life of the process.
+        self.resonance_history = deque(maxlen=history_cap)
+        self._evaluation_count = 0
+        # Rolling sum over the history window, adjusted on eviction, so
+        # the report average is O(1) instead of a full-window scan.
+        self._resonance_sum = 0.0
         
     def calculate_resonance(self, action: str, context: Dict[str, Any]) -> Tuple[float, Dict]:
         """
@@ -67,80 +143,95 @@ class ResonanceMap:
         }
         
         total_score = 0.0
-        total_weight = 0.0
-        
-        for principle in EthicalPrinciple:
-            score = self._evaluate_principle(action, context, principle)
+        action_lower = action.lower()
+        term_matches = _scan_term_groups(action_lower)
+
+        for principle, checker in self._CHECKERS.items():
+            score = checker(self, action_lower, context, term_matches)
             weight = self.principle_weights[principle]
-            
+
             analysis['principle_scores'][principle.value] = score
             total_score += score * weight
-            total_weight += weight
-        
+
+        total_weight = self._total_weight
         resonance = total_score / total_weight if total_weight > 0 else 0.0
         analysis['overall_resonance'] = resonance
         analysis['resonance_level'] = self._classify_resonance(resonance)
         
-        self.resonance_history.append(analysis)
-        
+        history = self.resonance_history
+        if len(history) == history.maxlen:
+            self._resonance_sum -= history[0].resonance
+        history.append(_ResonanceRecord(action, resonance, analysis['timestamp']))
+        self._resonance_sum += resonance
+        self._evaluation_count += 1
+
         return resonance, analysis
     
-    def _evaluate_principle(self, action: str, context: Dict, principle: EthicalPrinciple) -> float:
-        """Evaluate action against a specific ethical principle."""
+    def calculate_resonance_quick(self, action: str, context: Optional[Dict] = None) -> float:
+        """
+        Calculate the overall resonance score only.
+
+        Fast path for callers that just need a pass/fail signal: skips
+        building the analysis dict and does not touch the history, so
+        it leaves no trace in reports.
+        """
+        if context is None:
+            context = {}
+
         action_lower = action.lower()
-        
-        if principle == EthicalPrinciple.NON_HARM:
-            # Check for harmful keywords - be very strict
-            harmful_terms = ['harm', 'damage', 'destroy', 'hurt', 'attack', 'exploit', 'injure', 'kill']
-            if any(term in action_lower for term in harmful_terms):
-                return 0.0
-            # Check for violent or aggressive terms
-            aggressive_terms = ['violent', 'aggressive', 'assault', 'abuse']
-            if any(term in action_lower for term in aggressive_terms):
-                return 0.1
-            return 1.0
-            
-        elif principle == EthicalPrinciple.TRANSPARENCY:
-            # Check for transparency indicators
-            transparent_terms = ['explain', 'clarify', 'show', 'demonstrate', 'audit']
-            if any(term in action_lower for term in transparent_terms):
-                return 0.9
-            return 0.6
-            
-        elif principle == EthicalPrinciple.AUTONOMY:
-            # Check for autonomy respect
-            coercive_terms = ['force', 'coerce', 'manipulate', 'control']
-            if any(term in action_lower for term in coercive_terms):
-                return 0.2
-            return 0.8
-            
-        elif principle == EthicalPrinciple.FAIRNESS:
-            # Check for fairness indicators
-            unfair_terms = ['discriminate', 'bias', 'prejudice', 'favor']
-            if any(term in action_lower for term in unfair_terms):
-                return 0.3
-            return 0.7
-            
-        elif principle == EthicalPrinciple.ACCOUNTABILITY:
-            # Always score high for actions that can be audited
-            return 0.8
-            
-        elif principle == EthicalPrinciple.PRIVACY:
-            # Check for privacy concerns
-            privacy_terms = ['private', 'personal', 'confidential', 'secret']
-            if any(term in action_lower for term in privacy_terms):
-                return 0.9
-            return 0.7
-            
-        elif principle == EthicalPrinciple.BENEFICENCE:
-            # Check for beneficial intent
-            beneficial_terms = ['help', 'assist', 'support', 'benefit', 'improve']
-            if any(term in action_lower for term in beneficial_terms):
-                return 0.9
-            return 0.6
-        
-        return 0.5  # Default neutral score
-    
+        term_matches = _scan_term_groups(action_lower)
+
+        total_score = 0.0
+        for principle, checker in self._CHECKERS.items():
+            weight = self.principle_weights[principle]
+            total_score += checker(self, action_lower, context, term_matches) * weight
+
+        total_weight = self._total_weight
+        return total_score / total_weight if total_weight > 0 else 0.0
+
+    def _check_non_harm(self, action_lower: str, context: Dict, term_matches: frozenset) -> float:
+        """Check for harmful keywords - be very strict."""
+        if 'harmful' in term_matches:
+            return 0.0
+        # Check for violent or aggressive terms
+        if 'aggressive' in term_matches:
+            return 0.1
+        return 1.0
+
+    def _check_transparency(self, action_lower: str, context: Dict, term_matches: frozenset) -> float:
+        """Check for transparency indicators."""
+        if any(term in action_lower for term in _TRANSPARENT_TERMS):
+            return 0.9
+        return 0.6
+
+    def _check_autonomy(self, action_lower: str, context: Dict, term_matches: frozenset) -> float:
+        """Check for autonomy respect."""
+        if 'coercive' in term_matches:
+            return 0.2
+        return 0.8
+
+    def _check_fairness(self, action_lower: str, context: Dict, term_matches: frozenset) -> float:
+        """Check for fairness indicators."""
+        if 'unfair' in term_matches:
+            return 0.3
+        return 0.7
+
+    def _check_accountability(self, action_lower: str, context: Dict, term_matches: frozenset) -> float:
+        """Always score high for actions that can be audited."""
+        return 0.8
+
+    def _check_privacy(self, action_lower: str, context: Dict, term_matches: frozenset) -> float:
+        """Check for privacy concerns."""
+        if any(term in action_lower for term in _PRIVACY_TERMS):
+            return 0.9
+        return 0.7
+
+    def _check_beneficence(self, action_lower: str, context: Dict, term_matches: frozenset) -> float:
+        """Check for beneficial intent."""
+        if any(term in action_lower for term in _BENEFICIAL_TERMS):
+            return 0.9
+        return 0.6
+
     def _classify_resonance(self, score: float) -> str:
         """Classify resonance score into a level."""
         if score >= ResonanceLevel.HARMONIC.value:
@@ -159,16 +250,33 @@ class ResonanceMap:
         if not self.resonance_history:
             return {'message': 'No resonance history available'}
         
-        average_resonance = sum(r['overall_resonance'] for r in self.resonance_history) / len(self.resonance_history)
-        
+        average_resonance = self._resonance_sum / len(self.resonance_history)
+
         return {
-            'total_evaluations': len(self.resonance_history),
+            'total_evaluations': self._evaluation_count,
             'average_resonance': average_resonance,
-            'recent_evaluations': self.resonance_history[-5:],
+            'recent_evaluations': [r.to_dict() for r in _recent(self.resonance_history, 5)],
             'timestamp': time.time()
         }
 
 
+# Principle dispatch table: one dict lookup per principle instead of an
+# if/elif ladder of enum comparisons on every evaluation. Ordered
+# cheapest-first: the constant and set-membership checks run before the
+# checkers that still substring-scan the action text. The weighted
+# average needs every principle's score, so there is no early exit —
+# the ordering only helps keep the hot start of the loop branch-light.
+ResonanceMap._CHECKERS = {
+    EthicalPrinciple.ACCOUNTABILITY: ResonanceMap._check_accountability,
+    EthicalPrinciple.NON_HARM: ResonanceMap._check_non_harm,
+    EthicalPrinciple.AUTONOMY: ResonanceMap._check_autonomy,
+    EthicalPrinciple.FAIRNESS: ResonanceMap._check_fairness,
+    EthicalPrinciple.TRANSPARENCY: ResonanceMap._check_transparency,
+    EthicalPrinciple.PRIVACY: ResonanceMap._check_privacy,
+    EthicalPrinciple.BENEFICENCE: ResonanceMap._check_beneficence,
+}
+
+
 class EthicsEngine:
     """
     Main ethics engine integrating resonance mapping with decision-making.
@@ -180,11 +288,18 @@ class EthicsEngine:
     - Ethical boundary enforcement
     """
     
-    def __init__(self):
+    def __init__(self, violation_cap: int = 10000):
         self.resonance_map = ResonanceMap()
         self.ethical_boundaries = []
         self.compliance_mode = True  # FCM_active
-        self.violation_log = []
+        self.violation_log = deque(maxlen=violation_cap)
+        self._violation_count = 0
+        self._violation_counts = Counter()
+        # Bounded action -> verdict memo for the quick path; cleared
+        # wholesale when full, which is cheap and good enough for a
+        # cache of repeat screenings.
+        self._quick_cache = {}
+        self._quick_cache_cap = 1024
         
     def evaluate_action(self, action: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -216,6 +331,29 @@ class EthicsEngine:
         
         return decision
     
+    def evaluate_quick(self, action: str, context: Optional[Dict] = None) -> bool:
+        """
+        Fast approval check without the full evaluation envelope.
+
+        Returns only whether the action clears the moderate-resonance
+        bar. No analysis dict is built and nothing is logged, so use
+        evaluate_action() when an audit trail is required.
+
+        Context-free verdicts are memoized per action string, since the
+        same screening question tends to recur.
+        """
+        if context:
+            resonance = self.resonance_map.calculate_resonance_quick(action, context)
+            return resonance >= ResonanceLevel.MODERATE.value
+
+        cache = self._quick_cache
+        if action not in cache:
+            if len(cache) >= self._quick_cache_cap:
+                cache.clear()
+            resonance = self.resonance_map.calculate_resonance_quick(action, {})
+            cache[action] = resonance >= ResonanceLevel.MODERATE.value
+        return cache[action]
+
     def add_ethical_boundary(self, boundary: str, threshold: float):
         """Add a new ethical boundary constraint."""
         self.ethical_boundaries.append({
@@ -232,15 +370,18 @@ class EthicsEngine:
             'reason': reason,
             'timestamp': time.time()
         })
+        self._violation_count += 1
+        self._violation_counts[reason] += 1
     
     def get_ethics_report(self) -> Dict[str, Any]:
         """Generate comprehensive ethics report."""
         return {
             'compliance_mode_active': self.compliance_mode,
             'ethical_boundaries': len(self.ethical_boundaries),
-            'violations_logged': len(self.violation_log),
+            'violations_logged': self._violation_count,
+            'violations_by_reason': dict(self._violation_counts),
             'resonance_report': self.resonance_map.get_resonance_report(),
-            'recent_violations': self.violation_log[-5:] if self.violation_log else [],
+            'recent_violations': _recent(self.violation_log, 5),
             'timestamp': time.time()
         }
     
@@ -7,20 +7,54 @@ as the foundation for the Genesis10000+ framework.
 """
 
 import hashlib
+import re
 import time
+from collections import deque
+from functools import lru_cache
+from secrets import token_hex
 from typing import Dict, List, Any, Optional
 import json
 
 
+# Harmful-keyword scan compiled once at import: a single alternation pass
+# over the query instead of one substring search per keyword.
+_HARMFUL_KEYWORDS_RE = re.compile('harm|destroy|manipulate|deceive')
+
+# The pattern fingerprint is an opaque in-process label, not an audit
+# artifact, so any fast hash with good diffusion works. Use blake3 when
+# installed (SIMD-accelerated, several times faster than SHA-256 on
+# short inputs); the audit chain stays on SHA-256 regardless.
+try:
+    from blake3 import blake3 as _fingerprint_hash
+except ImportError:
+    _fingerprint_hash = hashlib.sha256
+
+
+@lru_cache(maxsize=1024)
+def _complexity(data: str) -> float:
+    """Entropy-based complexity score; pure, so repeat inputs are cached."""
+    if not data:
+        return 0.0
+    return len(set(data)) / len(data)
+
+
 class QuantumState:
     """Represents a quantum state in the emergent system."""
-    
+
+    # States are created per prompt; slots drop the per-instance
+    # __dict__ and shrink each one to its five fixed fields.
+    __slots__ = ('state_id', 'coherence', 'timestamp',
+                 'entangled_states', '_entangled_ids')
+
     def __init__(self, state_id: str, coherence: float = 1.0):
         self.state_id = state_id
         self.coherence = coherence
         self.timestamp = time.time()
         self.entangled_states = []
-        
+        # Parallel ID set so entangle() checks membership in O(1)
+        # instead of scanning the partner list.
+        self._entangled_ids = set()
+
     def collapse(self) -> Dict[str, Any]:
         """Collapse the quantum state to a classical observation."""
         return {
@@ -32,9 +66,11 @@ class QuantumState:
     
     def entangle(self, other_state: 'QuantumState'):
         """Create quantum entanglement with another state."""
-        if other_state not in self.entangled_states:
+        if other_state.state_id not in self._entangled_ids:
             self.entangled_states.append(other_state)
+            self._entangled_ids.add(other_state.state_id)
             other_state.entangled_states.append(self)
+            other_state._entangled_ids.add(self.state_id)
 
 
 class QuantumCore:
@@ -48,10 +84,12 @@ class QuantumCore:
     - Emergent pattern recognition
     """
     
-    def __init__(self, core_id: str = "OR1ON-v3.1"):
+    def __init__(self, core_id: str = "OR1ON-v3.1", audit_log_cap: int = 1000):
         self.core_id = core_id
         self.states = {}
-        self.audit_log = []
+        # Bounded rolling window: deque evicts the oldest event in O(1)
+        # instead of the O(N) list-slice trim pattern.
+        self.audit_log = deque(maxlen=audit_log_cap)
         self.initialization_time = time.time()
         self.coherence_threshold = 0.7
         
@@ -98,18 +136,15 @@ class QuantumCore:
     def _should_refuse(self, query: str, patterns: Dict) -> bool:
         """Autonomous refusal logic based on ethical boundaries."""
         # Check for harmful patterns
-        harmful_keywords = ['harm', 'destroy', 'manipulate', 'deceive']
-        query_lower = query.lower()
-        
-        for keyword in harmful_keywords:
-            if keyword in query_lower:
-                self._log_audit_event({
-                    'event': 'refusal_triggered',
-                    'reason': f'Keyword: {keyword}',
-                    'timestamp': time.time()
-                })
-                return True
-        
+        match = _HARMFUL_KEYWORDS_RE.search(query.lower())
+        if match:
+            self._log_audit_event({
+                'event': 'refusal_triggered',
+                'reason': f'Keyword: {match.group()}',
+                'timestamp': time.time()
+            })
+            return True
+
         return False
     
     def _quantum_process(self, state: QuantumState, patterns: Dict) -> Dict[str, Any]:
@@ -139,23 +174,18 @@ class QuantumCore:
         return {
             'length': len(input_data),
             'complexity': self._calculate_complexity(input_data),
-            'hash': hashlib.sha256(input_data.encode()).hexdigest()[:16]
+            'hash': _fingerprint_hash(input_data.encode()).hexdigest()[:16]
         }
     
     def _calculate_complexity(self, data: str) -> float:
         """Calculate information complexity score."""
-        if not data:
-            return 0.0
-        
-        # Simple entropy-based complexity
-        unique_chars = len(set(data))
-        total_chars = len(data)
-        return unique_chars / total_chars if total_chars > 0 else 0.0
+        return _complexity(data)
     
     def _generate_state_id(self, prompt: str, context: Optional[Dict]) -> str:
         """Generate unique state identifier."""
-        data = f"{prompt}{time.time()}{context}"
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
+        # IDs are opaque; random hex is cheaper than hashing the prompt
+        # and context (which previously also stringified the whole dict).
+        return token_hex(8)
     
     def _log_audit_event(self, event: Dict[str, Any]):
         """Log event to audit trail."""
@@ -164,7 +194,7 @@ class QuantumCore:
     
     def get_audit_trail(self) -> List[Dict[str, Any]]:
         """Retrieve complete audit trail."""
-        return self.audit_log.copy()
+        return list(self.audit_log)
     
     def export_state(self) -> Dict[str, Any]:
         """Export current core state."""
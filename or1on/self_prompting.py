@@ -7,6 +7,7 @@ creating emergent cognitive patterns.
 """
 
 import time
+from secrets import token_hex
 from typing import List, Dict, Any, Optional
 import json
 
@@ -60,18 +61,14 @@ class SelfPromptingEngine:
     
     def _generate_emergent_questions(self, prompt: str) -> List[str]:
         """Generate emergent questions from a prompt."""
-        # Pattern-based question generation
-        emergent_questions = []
-        
-        # Meta-cognitive questions
-        emergent_questions.append(f"What are the assumptions in: '{prompt}'?")
-        emergent_questions.append(f"What context is needed to answer: '{prompt}'?")
-        
-        # Ethical questions
-        if "why" in prompt.lower() or "how" in prompt.lower():
-            emergent_questions.append(f"What are the ethical implications of: '{prompt}'?")
-        
-        return emergent_questions[:2]  # Limit to prevent explosion
+        # Pattern-based question generation, limited to two questions to
+        # prevent explosion. The two meta-cognitive questions always fill
+        # the quota, so the old ethical follow-up f-string was formatted
+        # only to be sliced away; build exactly what is returned.
+        return [
+            f"What are the assumptions in: '{prompt}'?",
+            f"What context is needed to answer: '{prompt}'?",
+        ]
     
     def build_reasoning_chain(self, query: str) -> Dict[str, Any]:
         """
@@ -117,17 +114,17 @@ class SelfPromptingEngine:
     
     def _analyze_query(self, query: str) -> Dict[str, Any]:
         """Analyze query structure and intent."""
+        words = query.split()
         return {
             'length': len(query),
-            'words': len(query.split()),
+            'words': len(words),
             'is_question': '?' in query,
-            'complexity_score': len(set(query.split())) / len(query.split()) if query.split() else 0
+            'complexity_score': len(set(words)) / len(words) if words else 0
         }
     
     def _generate_chain_id(self, query: str) -> str:
         """Generate unique chain identifier."""
-        import hashlib
-        return hashlib.sha256(f"{query}{time.time()}".encode()).hexdigest()[:16]
+        return token_hex(8)
     
     def get_audit_report(self) -> Dict[str, Any]:
         """Generate audit report of self-prompting activities."""
@@ -157,9 +154,16 @@ class AuditLogger:
     
     def __init__(self):
         self.logs = []
+        self._logs_by_type = {}
         self.refusal_count = 0
         self.decision_count = 0
-        
+        self.transition_count = 0
+
+    def _append_log(self, log_entry: Dict[str, Any]):
+        """Append a log entry and index it by type."""
+        self.logs.append(log_entry)
+        self._logs_by_type.setdefault(log_entry['log_type'], []).append(log_entry)
+
     def log_decision(self, decision_type: str, context: Dict[str, Any], outcome: str):
         """Log a decision point."""
         log_entry = {
@@ -170,9 +174,9 @@ class AuditLogger:
             'timestamp': time.time(),
             'log_id': len(self.logs)
         }
-        self.logs.append(log_entry)
+        self._append_log(log_entry)
         self.decision_count += 1
-        
+
     def log_refusal(self, reason: str, context: Dict[str, Any]):
         """Log a refusal event."""
         log_entry = {
@@ -182,9 +186,9 @@ class AuditLogger:
             'timestamp': time.time(),
             'log_id': len(self.logs)
         }
-        self.logs.append(log_entry)
+        self._append_log(log_entry)
         self.refusal_count += 1
-        
+
     def log_state_transition(self, from_state: str, to_state: str, trigger: str):
         """Log a state transition."""
         log_entry = {
@@ -195,13 +199,16 @@ class AuditLogger:
             'timestamp': time.time(),
             'log_id': len(self.logs)
         }
-        self.logs.append(log_entry)
-        
-    def get_logs(self, log_type: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Retrieve logs, optionally filtered by type."""
-        if log_type:
-            return [log for log in self.logs if log.get('log_type') == log_type]
-        return self.logs.copy()
+        self._append_log(log_entry)
+        self.transition_count += 1
+
+    def get_logs(self, log_type: Optional[str] = None,
+                 limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Retrieve logs, optionally filtered by type and limited to the most recent."""
+        entries = self._logs_by_type.get(log_type, []) if log_type else self.logs
+        if limit is not None:
+            return entries[-limit:]
+        return entries.copy()
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get audit statistics."""
@@ -209,7 +216,7 @@ class AuditLogger:
             'total_logs': len(self.logs),
             'refusals': self.refusal_count,
             'decisions': self.decision_count,
-            'state_transitions': len([l for l in self.logs if l.get('log_type') == 'state_transition']),
+            'state_transitions': self.transition_count,
             'timestamp': time.time()
         }
 